@@ -216,9 +216,9 @@ class DBConnection:
         to prepare the database to hold Impuls model data."""
         statements: list[str] = [typ.sql_create_table() for typ in ALL_MODEL_ENTITIES]
 
+        # Run all DDL statements in a single transaction, to only sync the database file once
         conn = cls(path)
-        for statement in statements:
-            conn._con.executescript(statement)
+        conn._con.executescript("\n".join(["BEGIN TRANSACTION;", *statements, "COMMIT;"]))
         return conn
 
     @classmethod
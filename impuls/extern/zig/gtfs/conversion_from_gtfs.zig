@@ -215,6 +215,21 @@ test "gtfs.conversion_from_gtfs.optionalDate" {
 
 /// time parses "HH:MM:SS" GTFS time strings into a total number of seconds (an integer).
 pub fn time(str: []const u8, _: u32) InvalidValueT!ColumnValue {
+    // Fast path for the canonical, fixed-width "HH:MM:SS" form
+    if (str.len == 8 and str[2] == ':' and str[5] == ':') {
+        const digits = [6]u8{ str[0], str[1], str[3], str[4], str[6], str[7] };
+        var d: [6]u32 = undefined;
+        for (digits, &d) |char, *digit| {
+            if (!std.ascii.isDigit(char)) break;
+            digit.* = char - '0';
+        } else {
+            const h = d[0] * 10 + d[1];
+            const m = d[2] * 10 + d[3];
+            const s = d[4] * 10 + d[5];
+            return ColumnValue.int(@intCast(h * 3600 + m * 60 + s));
+        }
+    }
+
     var parts = std.mem.splitScalar(u8, str, ':');
     const h_str = parts.next() orelse return InvalidValue;
     const m_str = parts.next() orelse return InvalidValue;
@@ -229,9 +244,18 @@ pub fn time(str: []const u8, _: u32) InvalidValueT!ColumnValue {
 }
 
 test "gtfs.conversion_from_gtfs.time" {
-    const v = try time("12:15:30", 1);
+    var v = try time("12:15:30", 1);
     try std.testing.expectEqual(@as(i64, 12 * 3600 + 15 * 60 + 30), v.Int);
 
+    v = try time("25:01:08", 1);
+    try std.testing.expectEqual(@as(i64, 25 * 3600 + 1 * 60 + 8), v.Int);
+
+    v = try time("8:30:00", 1);
+    try std.testing.expectEqual(@as(i64, 8 * 3600 + 30 * 60), v.Int);
+
+    v = try time("100:00:00", 1);
+    try std.testing.expectEqual(@as(i64, 100 * 3600), v.Int);
+
     try std.testing.expectError(InvalidValue, time("", 1));
     try std.testing.expectError(InvalidValue, time("foo", 1));
     try std.testing.expectError(InvalidValue, time("12:15:30:00", 1));
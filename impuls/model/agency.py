@@ -11,7 +11,7 @@ from .meta.sql_builder import DataclassSQLBuilder
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class Agency(Entity):
     id: str
     name: str
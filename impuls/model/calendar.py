@@ -1,12 +1,10 @@
 from dataclasses import dataclass, field
-from functools import cached_property
 from typing import Sequence
 from typing import Type as TypeOf
 from typing import final
 
 from typing_extensions import LiteralString
 
-from ..tools.temporal import date_range
 from ..tools.types import Self, SQLNativeType
 from .meta.entity import Entity
 from .meta.sql_builder import DataclassSQLBuilder
@@ -14,7 +12,7 @@ from .meta.utility_types import Date
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class Calendar(Entity):
     id: str
     monday: bool = field(default=False, repr=False)
@@ -106,7 +104,7 @@ class Calendar(Entity):
             .kwargs()
         )
 
-    @cached_property
+    @property
     def compressed_weekdays(self) -> int:
         return (
             self.monday
@@ -128,11 +126,18 @@ class Calendar(Entity):
         if self.start_date == Date.SIGNALS_EXCEPTIONS and self.end_date == Date.SIGNALS_EXCEPTIONS:
             return set()
 
-        if self.compressed_weekdays == 0:
+        weekdays = self.compressed_weekdays
+        if weekdays == 0:
             return set()
 
+        if self.start_date > self.end_date:
+            raise ValueError(
+                f"Invalid DateRange: {self.start_date.isoformat()} ~ {self.end_date.isoformat()}"
+            )
+
+        # NOTE: Ordinal 1 (0001-01-01) is a Monday, so `(ordinal - 1) % 7` is the weekday
         return {
-            date
-            for date in date_range(self.start_date, self.end_date)
-            if self.compressed_weekdays & (1 << date.weekday())
+            Date.fromordinal(ordinal)
+            for ordinal in range(self.start_date.toordinal(), self.end_date.toordinal() + 1)
+            if weekdays & (1 << ((ordinal - 1) % 7))
         }
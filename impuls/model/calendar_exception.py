@@ -13,7 +13,7 @@ from .meta.utility_types import Date
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class CalendarException(Entity):
     class Type(IntEnum):
         ADDED = 1
@@ -57,7 +57,7 @@ class CalendarException(Entity):
         return (
             self.calendar_id,
             str(self.date),
-            self.exception_type.value,
+            int(self.exception_type),
         )
 
     def sql_primary_key(self) -> tuple[SQLNativeType, ...]:
@@ -82,11 +82,19 @@ class CalendarException(Entity):
         Warning! The provided set is both modified in-place and later returned.
 
         The set of active dates can come from Calendar.compute_active_dates.
+
+        If the same date is both added and removed by the provided exceptions,
+        the removal takes precedence.
         """
+        added_type = CalendarException.Type.ADDED
+        added: list[Date] = []
+        removed: list[Date] = []
         for exception in exceptions:
-            match exception.exception_type:
-                case CalendarException.Type.ADDED:
-                    active_dates.add(exception.date)
-                case CalendarException.Type.REMOVED:
-                    active_dates.discard(exception.date)
+            if exception.exception_type == added_type:
+                added.append(exception.date)
+            else:
+                removed.append(exception.date)
+
+        active_dates.update(added)
+        active_dates.difference_update(removed)
         return active_dates
@@ -12,7 +12,7 @@ from .meta.sql_builder import DataclassSQLBuilder
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class FareAttribute(Entity):
     class PaymentMethod(IntEnum):
         ON_BOARD = 0
@@ -69,7 +69,7 @@ class FareAttribute(Entity):
             self.id,
             self.price,
             self.currency_type,
-            self.payment_method.value,
+            int(self.payment_method),
             self.transfers,
             self.agency_id,
             self.transfer_duration,
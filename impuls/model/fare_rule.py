@@ -11,7 +11,7 @@ from .meta.sql_builder import DataclassSQLBuilder
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class FareRule(Entity):
     fare_id: str
     route_id: str = ""
@@ -12,7 +12,7 @@ from .meta.utility_types import Date
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class FeedInfo(Entity):
     publisher_name: str
     publisher_url: str = field(repr=False)
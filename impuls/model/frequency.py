@@ -12,7 +12,7 @@ from .meta.utility_types import TimePoint
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class Frequency(Entity):
     trip_id: str
     start_time: TimePoint
@@ -54,22 +54,22 @@ class Frequency(Entity):
     def sql_marshall(self) -> tuple[SQLNativeType, ...]:
         return (
             self.trip_id,
-            int(self.start_time.total_seconds()),
-            int(self.end_time.total_seconds()),
+            self.start_time.total_whole_seconds(),
+            self.end_time.total_whole_seconds(),
             self.headway,
             int(self.exact_times),
         )
 
     def sql_primary_key(self) -> tuple[SQLNativeType, ...]:
-        return (self.trip_id, int(self.start_time.total_seconds()))
+        return (self.trip_id, self.start_time.total_whole_seconds())
 
     @classmethod
     def sql_unmarshall(cls: TypeOf[Self], row: Sequence[SQLNativeType]) -> Self:
         return cls(
             **DataclassSQLBuilder(row)
             .field("trip_id", str)
-            .field("start_time", int, lambda x: TimePoint(seconds=x))
-            .field("end_time", int, lambda x: TimePoint(seconds=x))
+            .field("start_time", int, TimePoint.from_seconds)
+            .field("end_time", int, TimePoint.from_seconds)
             .field("headway", int)
             .field("exact_times", bool)
             .kwargs()
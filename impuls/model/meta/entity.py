@@ -12,6 +12,8 @@ class Entity(Protocol):
     Every entity defined in the model implements this protocol.
     """
 
+    __slots__ = ()
+
     @staticmethod
     def sql_table_name() -> LiteralString:
         """sql_table_name returns the SQL table name which holds entities of this type"""
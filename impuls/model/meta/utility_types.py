@@ -1,11 +1,14 @@
 import re
 from datetime import date, timedelta
+from functools import lru_cache
 from typing import ClassVar, Type
 
 from ...tools.types import Self
 
 
 class TimePoint(timedelta):
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Converts the TimePoint to a GTFS-compliant string
 
@@ -14,10 +17,34 @@ class TimePoint(timedelta):
         >>> str(TimePoint(hours=25, minutes=1, seconds=8))
         '25:01:08'
         """
-        m, s = divmod(int(self.total_seconds()), 60)
+        m, s = divmod(self.total_whole_seconds(), 60)
         h, m = divmod(m, 60)
         return f"{h:0>2}:{m:0>2}:{s:0>2}"
 
+    def total_whole_seconds(self) -> int:
+        """Returns the number of whole seconds in the TimePoint.
+        Equivalent to `int(self.total_seconds())`, but without going through a float.
+
+        >>> TimePoint(hours=25, minutes=1, seconds=8).total_whole_seconds()
+        90068
+        """
+        return self.days * 86400 + self.seconds
+
+    @staticmethod
+    @lru_cache(maxsize=16384)
+    def from_seconds(x: int) -> "TimePoint":
+        """Returns a TimePoint with the provided number of seconds.
+
+        Timetables only use a few thousand distinct times, so the immutable
+        TimePoint instances are cached and shared between all callers.
+
+        >>> TimePoint.from_seconds(30600)
+        TimePoint(seconds=30600)
+        >>> TimePoint.from_seconds(30600) is TimePoint.from_seconds(30600)
+        True
+        """
+        return TimePoint(seconds=x)
+
     @classmethod
     def from_str(cls: Type[Self], x: str) -> Self:
         """Parses a TimePoint from a HH:MM:SS strings
@@ -42,7 +69,7 @@ class Date(date):
         >>> str(Date(2012, 6, 1))
         '2012-06-01'
         """
-        return self.strftime("%Y-%m-%d")
+        return self.isoformat()
 
     @classmethod
     def from_ymd_str(cls: Type[Self], x: str) -> Self:
@@ -56,6 +83,10 @@ class Date(date):
         >>> Date.from_ymd_str("2012.02.29")
         Date(2012, 2, 29)
         """
+        # Fast path for the canonical YYYY-MM-DD form
+        if len(x) == 10 and x[4] == "-" and x[7] == "-":
+            return cls.fromisoformat(x)
+
         m = re.fullmatch(r"([0-9]{1,4})\W?([0-9]{1,2})\W?([0-9]{1,2})", x)
         if not m:
             raise ValueError(f"invalid year-month-date string: {x!r}")
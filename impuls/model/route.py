@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Optional, Sequence
@@ -12,7 +13,7 @@ from .meta.sql_builder import DataclassSQLBuilder
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class Route(Entity):
     class Type(IntEnum):
         TRAM = 0
@@ -81,7 +82,7 @@ class Route(Entity):
             self.agency_id,
             self.short_name,
             self.long_name,
-            self.type.value,
+            int(self.type),
             self.color,
             self.text_color,
             self.sort_order,
@@ -95,12 +96,12 @@ class Route(Entity):
         return cls(
             **DataclassSQLBuilder(row)
             .field("id", str)
-            .field("agency_id", str)
+            .field("agency_id", str, sys.intern)
             .field("short_name", str)
             .field("long_name", str)
             .field("type", int, cls.Type)
-            .field("color", str)
-            .field("text_color", str)
+            .field("color", str, sys.intern)
+            .field("text_color", str, sys.intern)
             .nullable_field("sort_order", int)
             .kwargs()
         )
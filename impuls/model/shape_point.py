@@ -11,7 +11,7 @@ from .meta.sql_builder import DataclassSQLBuilder
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class ShapePoint(Entity):
     shape_id: str
     sequence: int
@@ -1,3 +1,4 @@
+import sys
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Optional, Sequence
@@ -12,7 +13,7 @@ from .meta.sql_builder import DataclassSQLBuilder
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class Stop(Entity):
     class LocationType(IntEnum):
         STOP = 0
@@ -111,7 +112,7 @@ class Stop(Entity):
             .field("lat", float)
             .field("lon", float)
             .field("code", str)
-            .field("zone_id", str)
+            .field("zone_id", str, sys.intern)
             .field("location_type", int, lambda x: cls.LocationType(x))
             .optional_field("parent_station", str, lambda x: x or "")
             .nullable_field("wheelchair_boarding", bool)
@@ -13,7 +13,7 @@ from .meta.utility_types import TimePoint
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class StopTime(Entity):
     class PassengerExchange(IntEnum):
         SCHEDULED_STOP = 0
@@ -83,10 +83,10 @@ class StopTime(Entity):
             self.trip_id,
             self.stop_id,
             self.stop_sequence,
-            int(self.arrival_time.total_seconds()),
-            int(self.departure_time.total_seconds()),
-            self.pickup_type.value,
-            self.drop_off_type.value,
+            self.arrival_time.total_whole_seconds(),
+            self.departure_time.total_whole_seconds(),
+            int(self.pickup_type),
+            int(self.drop_off_type),
             self.stop_headsign,
             self.shape_dist_traveled,
             self.original_stop_id,
@@ -103,8 +103,8 @@ class StopTime(Entity):
             .field("trip_id", str)
             .field("stop_id", str)
             .field("stop_sequence", int)
-            .field("arrival_time", int, lambda x: TimePoint(seconds=x))
-            .field("departure_time", int, lambda x: TimePoint(seconds=x))
+            .field("arrival_time", int, TimePoint.from_seconds)
+            .field("departure_time", int, TimePoint.from_seconds)
             .field("pickup_type", int, cls.PassengerExchange)
             .field("drop_off_type", int, cls.PassengerExchange)
             .field("stop_headsign", str)
@@ -12,7 +12,7 @@ from .meta.sql_builder import DataclassSQLBuilder
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class Transfer(Entity):
     class Type(IntEnum):
         RECOMMENDED = 0
@@ -95,7 +95,7 @@ class Transfer(Entity):
             self.to_route_id or None,
             self.from_trip_id or None,
             self.to_trip_id or None,
-            self.type.value,
+            int(self.type),
             self.min_transfer_time,
         )
 
@@ -12,7 +12,7 @@ from .meta.sql_builder import DataclassSQLBuilder
 
 
 @final
-@dataclass
+@dataclass(slots=True)
 class Trip(Entity):
     class Direction(IntEnum):
         OUTBOUND = 0
@@ -95,7 +95,7 @@ class Trip(Entity):
             self.calendar_id,
             self.headsign,
             self.short_name,
-            self.direction.value if self.direction is not None else None,
+            int(self.direction) if self.direction is not None else None,
             self.block_id or None,
             self.shape_id or None,
             int(self.wheelchair_accessible) if self.wheelchair_accessible is not None else None,
@@ -4,7 +4,6 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from itertools import count
 from math import inf
-from operator import itemgetter
 from pathlib import Path
 from tempfile import mkstemp
 from typing import Container, Generator, Iterable, NamedTuple, Type, final
@@ -485,12 +484,18 @@ def pick_closest_stop(
     If there are no candidates at all, or there are no candidates max_distance_m radius,
     returns None.
     """
-    closest, distance_m = min(
-        ((s, earth_distance_m(incoming.lat, incoming.lon, s.lat, s.lon)) for s in candidates),
-        default=(None, inf),
-        key=itemgetter(1),
-    )
-    return closest if distance_m <= max_distance_m else None
+    lat = incoming.lat
+    lon = incoming.lon
+    closest: Stop | None = None
+    closest_distance_m = inf
+
+    for candidate in candidates:
+        distance_m = earth_distance_m(lat, lon, candidate.lat, candidate.lon)
+        if distance_m < closest_distance_m:
+            closest = candidate
+            closest_distance_m = distance_m
+
+    return closest if closest_distance_m <= max_distance_m else None
 
 
 def find_non_conflicting_id(used: Container[str], id: str, separator: str = ":") -> str:
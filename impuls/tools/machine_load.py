@@ -95,7 +95,7 @@ class LoadTracker:
     ...    n = 10358100653869
     ...    all(n % i != 0 for i in range(2, int(n ** .5) + 2))
     True
-    >>> 0.0 < load.delta_time < 1.0
+    >>> load.delta_time > 0.0
     True
     """
 
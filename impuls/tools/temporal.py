@@ -18,6 +18,8 @@ Infinite, LeftUnbounded and RightUnbounded ranges cover infinitely many days.
 
 
 class _DateRangeABC(ABC):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def compressed_weekdays(self) -> int:
@@ -105,6 +107,8 @@ class _DateRangeABC(ABC):
 class EmptyDateRange(_DateRangeABC):
     """EmptyDateRange is a range of dates without any dates."""
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return "EmptyDateRange()"
 
@@ -147,6 +151,8 @@ class EmptyDateRange(_DateRangeABC):
 class InfiniteDateRange(_DateRangeABC):
     """InfiniteDateRange is a range of dates covering every date."""
 
+    __slots__ = ()
+
     def __repr__(self) -> str:
         return "InfiniteDateRange()"
 
@@ -199,6 +205,8 @@ class InfiniteDateRange(_DateRangeABC):
 class LeftUnboundedDateRange(_DateRangeABC):
     """LeftUnboundedDateRange is a range of all dates up to (and including) the end date."""
 
+    __slots__ = ("end",)
+
     def __init__(self, end: Date) -> None:
         self.end = end
 
@@ -303,6 +311,8 @@ class LeftUnboundedDateRange(_DateRangeABC):
 class RightUnboundedDateRange(_DateRangeABC):
     """RightUnboundedDateRange is a range of all dates starting from the start date."""
 
+    __slots__ = ("start",)
+
     def __init__(self, start: Date) -> None:
         self.start = start
 
@@ -407,6 +417,8 @@ class RightUnboundedDateRange(_DateRangeABC):
 class BoundedDateRange(_DateRangeABC):
     """RightUnboundedDateRange is a range of all dates between start and end, inclusive."""
 
+    __slots__ = ("start", "end", "_cached_len", "_cached_compressed_weekdays")
+
     def __init__(self, start: Date, end: Date) -> None:
         self.start = start
         self.end = end
@@ -586,11 +598,11 @@ def date_range(start: Date | None, end: Date | None = None) -> DateRange:
     However, if both `start` and `end` are None - an exception is raised,
     please explicitly construct EmptyDateRange() or InfiniteDateRange().
     """
-    if start and end:
-        return BoundedDateRange(start, end)
-    elif start:
+    if start is not None:
+        if end is not None:
+            return BoundedDateRange(start, end)
         return RightUnboundedDateRange(start)
-    elif end:
+    elif end is not None:
         return LeftUnboundedDateRange(end)
     else:
         raise ValueError(
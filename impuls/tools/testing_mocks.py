@@ -1,12 +1,13 @@
 import itertools
-import operator
 import os
-import unittest.mock
+import pkgutil
 from contextlib import ExitStack, contextmanager
 from datetime import datetime, timedelta, timezone, tzinfo
+from io import BytesIO
 from pathlib import Path
 from shutil import rmtree
 from tempfile import mkdtemp, mkstemp
+from types import MappingProxyType
 from typing import Any, Generator, Iterable, Iterator, Mapping, Optional, Protocol, Type
 
 import requests
@@ -15,11 +16,30 @@ from ..errors import InputNotModified
 from ..resource import DATETIME_MIN_UTC, Resource
 from .types import Self
 
+_EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+
 
 class DatetimeNowLike(Protocol):
     def __call__(self, tz: Optional[tzinfo] = ...) -> datetime: ...
 
 
+class _PatchedDatetime:
+    """_PatchedDatetime stands in for the datetime class, replacing only the `now` method.
+    Every other attribute access and calls are forwarded to the real datetime class.
+    """
+
+    __slots__ = ("now",)
+
+    def __init__(self, now: DatetimeNowLike) -> None:
+        self.now = now
+
+    def __call__(self, *args: Any, **kwargs: Any) -> datetime:
+        return datetime(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(datetime, name)
+
+
 class MockDatetimeNow:
     """
     MockDatetimeNow is a helper for mocking datetime.now,
@@ -47,16 +67,42 @@ class MockDatetimeNow:
     StopIteration
     """
 
+    __slots__ = ("it", "_converted")
+
     def __init__(self, times: Iterable[datetime]) -> None:
         self.it = iter(times)
+        self._converted: dict[tzinfo, datetime] | None = None
 
     def now(self, tz: Optional[tzinfo] = None) -> datetime:
+        if self._converted is not None and tz:
+            # Fast path for constant clocks - every returned datetime is the same,
+            # so the timezone conversion only needs to happen once per tz.
+            if converted := self._converted.get(tz):
+                return converted
+            converted = next(self.it).astimezone(tz)
+            self._converted[tz] = converted
+            return converted
+
         dt = next(self.it)
-        return dt.astimezone(tz) if tz else dt
+        if not tz or dt.tzinfo is tz:
+            return dt
+        return dt.astimezone(tz)
 
     @classmethod
     def constant(cls: Type[Self], t: datetime) -> Self:
-        return cls(itertools.repeat(t))
+        """constant provides an infinite MockDatetimeNow which always returns `t`.
+
+        >>> fake_dt_now = MockDatetimeNow.constant(
+        ...     datetime(2020, 1, 30, 5, 10, tzinfo=timezone.utc),
+        ... ).now
+        >>> fake_dt_now()
+        datetime.datetime(2020, 1, 30, 5, 10, tzinfo=datetime.timezone.utc)
+        >>> fake_dt_now(timezone(timedelta(hours=1))).isoformat()
+        '2020-01-30T06:10:00+01:00'
+        """
+        mock = cls(itertools.repeat(t))
+        mock._converted = {}
+        return mock
 
     @classmethod
     def evenly_spaced(cls: Type[Self], start: datetime, delta: timedelta) -> Self:
@@ -75,14 +121,23 @@ class MockDatetimeNow:
         >>> fake_dt_now()
         datetime.datetime(2020, 1, 30, 5, 30)
         """
-        return cls(itertools.accumulate(itertools.repeat(delta), operator.add, initial=start))
+        return cls(start + i * delta for i in itertools.count())
 
     @contextmanager
     def patch(self, *datetime_targets: str) -> Generator[None, None, None]:
+        """patch replaces the datetime class under the provided dotted paths
+        (like "impuls.resource.datetime") with an object whose `now` is `self.now`.
+        The original attributes are restored on exit.
+
+        The attributes are swapped directly, without the overhead of unittest.mock.
+        """
+        replacement = _PatchedDatetime(self.now)
         with ExitStack() as s:
             for datetime_target in datetime_targets:
-                mock = s.enter_context(unittest.mock.patch(datetime_target, wraps=datetime))
-                mock.now.side_effect = self.now  # type: ignore
+                owner_name, attr = datetime_target.rsplit(".", maxsplit=1)
+                owner = pkgutil.resolve_name(owner_name)
+                s.callback(setattr, owner, attr, getattr(owner, attr))
+                setattr(owner, attr, replacement)
             yield
 
 
@@ -95,16 +150,18 @@ class MockHTTPResponse:
     200
     >>> r.content
     b'Hello!'
-    >>> r.headers
+    >>> dict(r.headers)
     {}
     """
 
+    __slots__ = ("status_code", "content", "headers")
+
     def __init__(
-        self, status_code: int, content: bytes = b"", headers: Optional[Mapping[str, str]] = {}
+        self, status_code: int, content: bytes = b"", headers: Optional[Mapping[str, str]] = None
     ) -> None:
         self.status_code = status_code
         self.content = content
-        self.headers = headers or {}
+        self.headers = headers or _EMPTY_HEADERS
 
     def __enter__(self) -> "MockHTTPResponse":
         """
@@ -130,20 +187,35 @@ class MockHTTPResponse:
         if self.status_code >= 400:
             raise requests.HTTPError(str(self.status_code))
 
-    def iter_content(self, chunk_size: int = 16, decode_unicode: bool = False) -> Iterable[bytes]:
+    def iter_content(
+        self,
+        chunk_size: Optional[int] = 16,
+        decode_unicode: bool = False,
+    ) -> Iterable[bytes]:
         """iter_content generates self.content in chunks of the provided size.
+        If chunk_size is None, the whole content is generated in a single chunk.
         For now decode_unicode must be False.
 
         >>> r = MockHTTPResponse(200, b"Lorem ipsum dolor sit")
         >>> list(r.iter_content(8))
         [b'Lorem ip', b'sum dolo', b'r sit']
+        >>> list(r.iter_content(None))
+        [b'Lorem ipsum dolor sit']
         """
         assert not decode_unicode
+        assert chunk_size is None or chunk_size > 0
 
-        rest = self.content
-        while rest:
-            yield rest[:chunk_size]
-            rest = rest[chunk_size:]
+        n = len(self.content)
+        if not n:
+            return
+        elif chunk_size is None or chunk_size >= n:
+            yield self.content
+            return
+
+        buffer = BytesIO(self.content)
+        read = buffer.read
+        while chunk := read(chunk_size):
+            yield chunk
 
 
 class MockResource(Resource):
@@ -179,7 +251,7 @@ class MockResource(Resource):
         ):
             raise InputNotModified
         self.fetch_time = self.clock(timezone.utc)
-        yield self.content
+        return iter((self.content,))
 
     def refresh(self) -> None:
         self.last_modified = self.clock(timezone.utc)
@@ -196,6 +268,8 @@ class MockFile:
     'Hello, world!'
     """
 
+    __slots__ = ("path",)
+
     path: Path
 
     def __init__(
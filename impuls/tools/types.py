@@ -3,6 +3,19 @@ import typing
 from os import PathLike
 from typing import TYPE_CHECKING, AnyStr, Type, TypeGuard, TypeVar, Union
 
+__all__ = [
+    "AnyPath",
+    "BytesPath",
+    "GenericPath",
+    "SQLNativeType",
+    "Self",
+    "StrPath",
+    "T",
+    "all_non_none",
+    "identity",
+    "union_to_tuple_of_types",
+]
+
 if TYPE_CHECKING:
     from typing_extensions import Self
 else:
@@ -56,4 +69,4 @@ def all_non_none(lst: list[T | None]) -> TypeGuard[list[T]]:
     >>> all_non_none(["", "a", "b", None, "c"])
     False
     """
-    return all(i is not None for i in lst)
+    return None not in lst
@@ -1,7 +1,8 @@
 import re
+import typing
 import unittest
 from abc import ABC, abstractmethod
-from typing import Generic, Type
+from typing import Any, Generic, Type
 
 from impuls.model import EntityT
 
@@ -14,48 +15,68 @@ class AbstractTestEntity:
     #       See https://stackoverflow.com/a/50176291.
 
     class Template(ABC, unittest.TestCase, Generic[EntityT]):
+        entity_type: Type[EntityT]
+        """entity_type is the tested entity class, automatically resolved from
+        the type argument of the Template when a test case is defined."""
+
+        def __init_subclass__(cls, **kwargs: Any) -> None:
+            super().__init_subclass__(**kwargs)
+            for base in getattr(cls, "__orig_bases__", ()):
+                if typing.get_origin(base) is AbstractTestEntity.Template:
+                    cls.entity_type = typing.get_args(base)[0]
+
         @abstractmethod
         def get_entity(self) -> EntityT:
             raise NotImplementedError
 
-        @abstractmethod
-        def get_type(self) -> Type[EntityT]:
-            raise NotImplementedError
+        def canonical_entity(self) -> EntityT:
+            """canonical_entity returns the entity created by get_entity,
+            constructed only once per test case class.
+
+            The returned entity is shared between tests and must not be modified -
+            use dataclasses.replace to obtain a modified copy.
+            """
+            cls = type(self)
+            entity: EntityT | None = vars(cls).get("_canonical_entity")
+            if entity is None:
+                entity = self.get_entity()
+                setattr(cls, "_canonical_entity", entity)
+            return entity
 
         def test_sql_table_name(self) -> None:
-            self.assertRegex(self.get_type().sql_table_name(), TABLE_NAME_REGEX)
+            self.assertRegex(self.entity_type.sql_table_name(), TABLE_NAME_REGEX)
 
         def test_sql_columns(self) -> None:
-            self.assertRegex(self.get_type().sql_columns(), r"^\((?:[a-z_]+, )*[a-z_]+\)")
+            self.assertRegex(self.entity_type.sql_columns(), r"^\((?:[a-z_]+, )*[a-z_]+\)")
             self.assertEqual(
-                len(self.get_entity().sql_marshall()),
-                self.get_type().sql_columns().count(",") + 1,
+                len(self.canonical_entity().sql_marshall()),
+                self.entity_type.sql_columns().count(",") + 1,
             )
 
         def test_sql_placeholder(self) -> None:
-            self.assertRegex(self.get_type().sql_placeholder(), r"^\((?:\?, )*\?\)$")
+            self.assertRegex(self.entity_type.sql_placeholder(), r"^\((?:\?, )*\?\)$")
             self.assertEqual(
-                len(self.get_entity().sql_marshall()),
-                self.get_type().sql_placeholder().count("?"),
+                len(self.canonical_entity().sql_marshall()),
+                self.entity_type.sql_placeholder().count("?"),
             )
 
         def test_sql_where_clause(self) -> None:
             self.assertRegex(
-                self.get_type().sql_where_clause(),
+                self.entity_type.sql_where_clause(),
                 r"^[a-z_]+ = \?(?: AND [a-z_]+ = \?)*$",
             )
             self.assertEqual(
-                len(self.get_entity().sql_primary_key()),
-                self.get_type().sql_where_clause().count("?"),
+                len(self.canonical_entity().sql_primary_key()),
+                self.entity_type.sql_where_clause().count("?"),
             )
 
         def test_sql_set_clause(self) -> None:
             self.assertRegex(
-                self.get_type().sql_set_clause(), r"^[a-z_]+ = \?(?:, [a-z_]+ = \?)*$"
+                self.entity_type.sql_set_clause(), r"^[a-z_]+ = \?(?:, [a-z_]+ = \?)*$"
             )
             self.assertEqual(
-                len(self.get_entity().sql_marshall()),
-                self.get_type().sql_set_clause().count("?"),
+                len(self.canonical_entity().sql_marshall()),
+                self.entity_type.sql_set_clause().count("?"),
             )
 
         @abstractmethod
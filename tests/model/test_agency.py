@@ -1,4 +1,4 @@
-from typing import Type, final
+from typing import final
 
 from impuls.model import Agency
 
@@ -18,17 +18,14 @@ class TestAgency(AbstractTestEntity.Template[Agency]):
             fare_url="",
         )
 
-    def get_type(self) -> Type[Agency]:
-        return Agency
-
     def test_sql_marshall(self) -> None:
         self.assertTupleEqual(
-            self.get_entity().sql_marshall(),
+            self.canonical_entity().sql_marshall(),
             ("0", "Foo", "https://example.com/", "Europe/Brussels", "en", "", ""),
         )
 
     def test_sql_primary_key(self) -> None:
-        self.assertTupleEqual(self.get_entity().sql_primary_key(), ("0",))
+        self.assertTupleEqual(self.canonical_entity().sql_primary_key(), ("0",))
 
     def test_sql_unmarshall(self) -> None:
         a = Agency.sql_unmarshall(
@@ -43,10 +40,4 @@ class TestAgency(AbstractTestEntity.Template[Agency]):
             )
         )
 
-        self.assertEqual(a.id, "0")
-        self.assertEqual(a.name, "Foo")
-        self.assertEqual(a.url, "https://example.com/")
-        self.assertEqual(a.timezone, "Europe/Brussels")
-        self.assertEqual(a.lang, "en")
-        self.assertEqual(a.phone, "")
-        self.assertEqual(a.fare_url, "")
+        self.assertEqual(a, self.canonical_entity())
@@ -1,4 +1,4 @@
-from typing import Type, final
+from typing import final
 
 from impuls.model import Attribution
 
@@ -20,27 +20,16 @@ class TestAttribution(AbstractTestEntity.Template[Attribution]):
             phone="",
         )
 
-    def get_type(self) -> Type[Attribution]:
-        return Attribution
-
     def test_sql_marshall(self) -> None:
         self.assertTupleEqual(
-            self.get_entity().sql_marshall(),
+            self.canonical_entity().sql_marshall(),
             ("0", "Foo", 1, 0, 1, 1, "https://example.com/", "", ""),
         )
 
     def test_sql_primary_key(self) -> None:
-        self.assertTupleEqual(self.get_entity().sql_primary_key(), ("0",))
+        self.assertTupleEqual(self.canonical_entity().sql_primary_key(), ("0",))
 
     def test_sql_unmarshall(self) -> None:
         a = Attribution.sql_unmarshall(("0", "Foo", 1, 0, 1, 1, "https://example.com/", "", ""))
 
-        self.assertEqual(a.id, "0")
-        self.assertEqual(a.organization_name, "Foo")
-        self.assertEqual(a.is_producer, True)
-        self.assertEqual(a.is_operator, False)
-        self.assertEqual(a.is_authority, True)
-        self.assertEqual(a.is_data_source, True)
-        self.assertEqual(a.url, "https://example.com/")
-        self.assertEqual(a.email, "")
-        self.assertEqual(a.phone, "")
+        self.assertEqual(a, self.canonical_entity())
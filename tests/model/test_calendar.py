@@ -1,4 +1,4 @@
-from typing import Type, final
+from typing import final
 
 from impuls.model import Calendar, Date
 
@@ -22,37 +22,24 @@ class TestCalendar(AbstractTestEntity.Template[Calendar]):
             desc="Workdays",
         )
 
-    def get_type(self) -> Type[Calendar]:
-        return Calendar
-
     def test_sql_marshall(self) -> None:
         self.assertTupleEqual(
-            self.get_entity().sql_marshall(),
+            self.canonical_entity().sql_marshall(),
             ("0", 1, 1, 1, 1, 1, 0, 0, "2020-01-01", "2020-03-31", "Workdays"),
         )
 
     def test_sql_primary_key(self) -> None:
-        self.assertTupleEqual(self.get_entity().sql_primary_key(), ("0",))
+        self.assertTupleEqual(self.canonical_entity().sql_primary_key(), ("0",))
 
     def test_sql_unmarshall(self) -> None:
         c = Calendar.sql_unmarshall(
             ("0", 1, 1, 1, 1, 1, 0, 0, "2020-01-01", "2020-03-31", "Workdays"),
         )
 
-        self.assertEqual(c.id, "0")
-        self.assertEqual(c.monday, True)
-        self.assertEqual(c.tuesday, True)
-        self.assertEqual(c.wednesday, True)
-        self.assertEqual(c.thursday, True)
-        self.assertEqual(c.friday, True)
-        self.assertEqual(c.saturday, False)
-        self.assertEqual(c.sunday, False)
-        self.assertEqual(c.start_date, Date(2020, 1, 1))
-        self.assertEqual(c.end_date, Date(2020, 3, 31))
-        self.assertEqual(c.desc, "Workdays")
+        self.assertEqual(c, self.canonical_entity())
 
     def test_compressed_weekdays(self) -> None:
-        self.assertEqual(self.get_entity().compressed_weekdays, 0b001_1111)
+        self.assertEqual(self.canonical_entity().compressed_weekdays, 0b001_1111)
 
     def test_compute_active_dates(self) -> None:
         c = Calendar(
@@ -78,3 +65,19 @@ class TestCalendar(AbstractTestEntity.Template[Calendar]):
                 Date(2020, 1, 9),
             },
         )
+
+    def test_compute_active_dates_start_after_end(self) -> None:
+        c = Calendar(
+            id="0",
+            monday=True,
+            tuesday=True,
+            wednesday=True,
+            thursday=True,
+            friday=True,
+            saturday=False,
+            sunday=False,
+            start_date=Date(2020, 1, 11),
+            end_date=Date(2020, 1, 1),
+        )
+        with self.assertRaises(ValueError):
+            c.compute_active_dates()
@@ -1,4 +1,4 @@
-from typing import Type, final
+from typing import final
 
 from impuls.model import CalendarException, Date
 
@@ -14,21 +14,16 @@ class TestCalendarException(AbstractTestEntity.Template[CalendarException]):
             exception_type=CalendarException.Type.ADDED,
         )
 
-    def get_type(self) -> Type[CalendarException]:
-        return CalendarException
-
     def test_sql_marshall(self) -> None:
-        self.assertTupleEqual(self.get_entity().sql_marshall(), ("0", "2020-02-29", 1))
+        self.assertTupleEqual(self.canonical_entity().sql_marshall(), ("0", "2020-02-29", 1))
 
     def test_sql_primary_key(self) -> None:
-        self.assertTupleEqual(self.get_entity().sql_primary_key(), ("0", "2020-02-29"))
+        self.assertTupleEqual(self.canonical_entity().sql_primary_key(), ("0", "2020-02-29"))
 
     def test_sql_unmarshall(self) -> None:
         ce = CalendarException.sql_unmarshall(("0", "2020-02-29", 1))
 
-        self.assertEqual(ce.calendar_id, "0")
-        self.assertEqual(ce.date, Date(2020, 2, 29))
-        self.assertEqual(ce.exception_type, CalendarException.Type.ADDED)
+        self.assertEqual(ce, self.canonical_entity())
 
     def test_reflect_in_active_dates(self) -> None:
         dates = {
@@ -57,3 +52,23 @@ class TestCalendarException(AbstractTestEntity.Template[CalendarException]):
                 Date(2020, 1, 10),
             },
         )
+
+    def test_reflect_in_active_dates_added_then_removed(self) -> None:
+        dates = {Date(2020, 1, 9)}
+        exceptions = [
+            CalendarException("0", Date(2020, 1, 10), CalendarException.Type.ADDED),
+            CalendarException("0", Date(2020, 1, 10), CalendarException.Type.REMOVED),
+        ]
+
+        returned_dates = CalendarException.reflect_in_active_dates(dates, exceptions)
+        self.assertSetEqual(returned_dates, {Date(2020, 1, 9)})
+
+    def test_reflect_in_active_dates_removed_then_added(self) -> None:
+        dates = {Date(2020, 1, 9)}
+        exceptions = [
+            CalendarException("0", Date(2020, 1, 10), CalendarException.Type.REMOVED),
+            CalendarException("0", Date(2020, 1, 10), CalendarException.Type.ADDED),
+        ]
+
+        returned_dates = CalendarException.reflect_in_active_dates(dates, exceptions)
+        self.assertSetEqual(returned_dates, {Date(2020, 1, 9)})
@@ -1,4 +1,5 @@
-from typing import Type, final
+from dataclasses import replace
+from typing import final
 
 from impuls.model import FareAttribute
 
@@ -18,35 +19,24 @@ class TestFareAttribute(AbstractTestEntity.Template[FareAttribute]):
             transfer_duration=None,
         )
 
-    def get_type(self) -> Type[FareAttribute]:
-        return FareAttribute
-
     def test_sql_marshall(self) -> None:
         self.assertTupleEqual(
-            self.get_entity().sql_marshall(),
+            self.canonical_entity().sql_marshall(),
             ("F0", 1.5, "EUR", 0, 0, "A0", None),
         )
 
     def test_sql_marshall_unlimited_transfers_max_duration(self) -> None:
-        f = self.get_entity()
-        f.transfers = None
-        f.transfer_duration = 3600
+        f = replace(self.canonical_entity(), transfers=None, transfer_duration=3600)
 
         self.assertTupleEqual(f.sql_marshall(), ("F0", 1.5, "EUR", 0, None, "A0", 3600))
 
     def test_sql_primary_key(self) -> None:
-        self.assertTupleEqual(self.get_entity().sql_primary_key(), ("F0",))
+        self.assertTupleEqual(self.canonical_entity().sql_primary_key(), ("F0",))
 
     def test_sql_unmarshall(self) -> None:
         f = FareAttribute.sql_unmarshall(("F0", 1.5, "EUR", 0, 0, "A0", None))
 
-        self.assertEqual(f.id, "F0")
-        self.assertEqual(f.price, 1.5)
-        self.assertEqual(f.currency_type, "EUR")
-        self.assertEqual(f.payment_method, FareAttribute.PaymentMethod.ON_BOARD)
-        self.assertEqual(f.transfers, 0)
-        self.assertEqual(f.agency_id, "A0")
-        self.assertIsNone(f.transfer_duration)
+        self.assertEqual(f, self.canonical_entity())
 
     def test_sql_unmarshall_unlimited_transfers_max_duration(self) -> None:
         f = FareAttribute.sql_unmarshall(("F0", 1.5, "EUR", 0, None, "A0", 3600))
@@ -1,4 +1,5 @@
-from typing import Type, final
+from dataclasses import replace
+from typing import final
 
 from impuls.model import ShapePoint
 
@@ -15,18 +16,14 @@ class TestShapePoint(AbstractTestEntity.Template[ShapePoint]):
             lon=-3.14,
         )
 
-    def get_type(self) -> Type[ShapePoint]:
-        return ShapePoint
-
     def test_sql_marshall(self) -> None:
         self.assertTupleEqual(
-            self.get_entity().sql_marshall(),
+            self.canonical_entity().sql_marshall(),
             ("Sh0", 0, 1.5, -3.14, None),
         )
 
     def test_sql_marshall_shape_dist_traveled(self) -> None:
-        st = self.get_entity()
-        st.shape_dist_traveled = 5.1
+        st = replace(self.canonical_entity(), shape_dist_traveled=5.1)
 
         self.assertTupleEqual(
             st.sql_marshall(),
@@ -34,16 +31,12 @@ class TestShapePoint(AbstractTestEntity.Template[ShapePoint]):
         )
 
     def test_sql_primary_key(self) -> None:
-        self.assertTupleEqual(self.get_entity().sql_primary_key(), ("Sh0", 0))
+        self.assertTupleEqual(self.canonical_entity().sql_primary_key(), ("Sh0", 0))
 
     def test_sql_unmarshall(self) -> None:
         sp = ShapePoint.sql_unmarshall(("Sh0", 0, 1.5, -3.14, None))
 
-        self.assertEqual(sp.shape_id, "Sh0")
-        self.assertEqual(sp.sequence, 0)
-        self.assertEqual(sp.lat, 1.5)
-        self.assertEqual(sp.lon, -3.14)
-        self.assertIsNone(sp.shape_dist_traveled)
+        self.assertEqual(sp, self.canonical_entity())
 
     def test_sql_unmarshall_shape_dist_traveled(self) -> None:
         sp = ShapePoint.sql_unmarshall(("Sh0", 0, 1.5, -3.14, 5.1))
@@ -1,4 +1,5 @@
-from typing import Type, final
+from dataclasses import replace
+from typing import final
 
 from impuls.model import Stop
 
@@ -23,18 +24,14 @@ class TestStop(AbstractTestEntity.Template[Stop]):
             ibnr_code="",
         )
 
-    def get_type(self) -> Type[Stop]:
-        return Stop
-
     def test_sql_marshall(self) -> None:
         self.assertTupleEqual(
-            self.get_entity().sql_marshall(),
+            self.canonical_entity().sql_marshall(),
             ("0", "Foo", 50.847, 4.383, "S0", "", 0, None, 1, "", "", ""),
         )
 
     def test_sql_marshall_parent_station(self) -> None:
-        s = self.get_entity()
-        s.parent_station = "1"
+        s = replace(self.canonical_entity(), parent_station="1")
 
         self.assertTupleEqual(
             s.sql_marshall(),
@@ -42,23 +39,12 @@ class TestStop(AbstractTestEntity.Template[Stop]):
         )
 
     def test_sql_primary_key(self) -> None:
-        self.assertTupleEqual(self.get_entity().sql_primary_key(), ("0",))
+        self.assertTupleEqual(self.canonical_entity().sql_primary_key(), ("0",))
 
     def test_sql_unmarshall(self) -> None:
         s = Stop.sql_unmarshall(("0", "Foo", 50.847, 4.383, "S0", "", 0, None, 1, "", "", ""))
 
-        self.assertEqual(s.id, "0")
-        self.assertEqual(s.name, "Foo")
-        self.assertEqual(s.lat, 50.847)
-        self.assertEqual(s.lon, 4.383)
-        self.assertEqual(s.code, "S0")
-        self.assertEqual(s.zone_id, "")
-        self.assertEqual(s.location_type, Stop.LocationType.STOP)
-        self.assertEqual(s.parent_station, "")
-        self.assertEqual(s.wheelchair_boarding, True)
-        self.assertEqual(s.platform_code, "")
-        self.assertEqual(s.pkpplk_code, "")
-        self.assertEqual(s.ibnr_code, "")
+        self.assertEqual(s, self.canonical_entity())
 
     def test_sql_unmarshall_parent_station(self) -> None:
         s = Stop.sql_unmarshall(("0", "Foo", 50.847, 4.383, "S0", "", 0, "1", 1, "", "", ""))
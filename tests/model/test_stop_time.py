@@ -1,4 +1,5 @@
-from typing import Type, final
+from dataclasses import replace
+from typing import final
 
 from impuls.model import StopTime, TimePoint
 
@@ -22,19 +23,18 @@ class TestStopTime(AbstractTestEntity.Template[StopTime]):
             platform="A",
         )
 
-    def get_type(self) -> Type[StopTime]:
-        return StopTime
-
     def test_sql_marshall(self) -> None:
         self.assertTupleEqual(
-            self.get_entity().sql_marshall(),
+            self.canonical_entity().sql_marshall(),
             ("T0", "S0", 5, 36600, 36630, 3, 3, "", None, "", "A"),
         )
 
     def test_sql_marshall_past_midnight(self) -> None:
-        st = self.get_entity()
-        st.arrival_time = TimePoint(hours=25, minutes=10, seconds=0)
-        st.departure_time = TimePoint(hours=25, minutes=10, seconds=30)
+        st = replace(
+            self.canonical_entity(),
+            arrival_time=TimePoint(hours=25, minutes=10, seconds=0),
+            departure_time=TimePoint(hours=25, minutes=10, seconds=30),
+        )
 
         self.assertTupleEqual(
             st.sql_marshall(),
@@ -42,8 +42,7 @@ class TestStopTime(AbstractTestEntity.Template[StopTime]):
         )
 
     def test_sql_marshall_shape_dist_traveled(self) -> None:
-        st = self.get_entity()
-        st.shape_dist_traveled = 5.1
+        st = replace(self.canonical_entity(), shape_dist_traveled=5.1)
 
         self.assertTupleEqual(
             st.sql_marshall(),
@@ -51,22 +50,12 @@ class TestStopTime(AbstractTestEntity.Template[StopTime]):
         )
 
     def test_sql_primary_key(self) -> None:
-        self.assertTupleEqual(self.get_entity().sql_primary_key(), ("T0", 5))
+        self.assertTupleEqual(self.canonical_entity().sql_primary_key(), ("T0", 5))
 
     def test_sql_unmarshall(self) -> None:
         st = StopTime.sql_unmarshall(("T0", "S0", 5, 36600, 36630, 3, 3, "", None, "", "A"))
 
-        self.assertEqual(st.trip_id, "T0")
-        self.assertEqual(st.stop_id, "S0")
-        self.assertEqual(st.stop_sequence, 5)
-        self.assertEqual(st.arrival_time, TimePoint(hours=10, minutes=10, seconds=0))
-        self.assertEqual(st.departure_time, TimePoint(hours=10, minutes=10, seconds=30))
-        self.assertEqual(st.pickup_type, StopTime.PassengerExchange.ON_REQUEST)
-        self.assertEqual(st.drop_off_type, StopTime.PassengerExchange.ON_REQUEST)
-        self.assertEqual(st.stop_headsign, "")
-        self.assertEqual(st.shape_dist_traveled, None)
-        self.assertEqual(st.original_stop_id, "")
-        self.assertEqual(st.platform, "A")
+        self.assertEqual(st, self.canonical_entity())
 
     def test_sql_unmarshall_past_midnight(self) -> None:
         st = StopTime.sql_unmarshall(("T0", "S0", 5, 90600, 90630, 3, 3, "", None, "", "A"))
@@ -1,4 +1,5 @@
-from typing import Type, final
+from dataclasses import replace
+from typing import final
 
 from impuls.model import Trip
 
@@ -22,23 +23,22 @@ class TestAgency(AbstractTestEntity.Template[Trip]):
             exceptional=False,
         )
 
-    def get_type(self) -> Type[Trip]:
-        return Trip
-
     def test_sql_marshall(self) -> None:
         self.assertTupleEqual(
-            self.get_entity().sql_marshall(),
+            self.canonical_entity().sql_marshall(),
             ("0", "R0", "C0", "Foo", "", 0, "B0", "S0", 1, 0, 0),
         )
 
     def test_sql_marshall_unknowns(self) -> None:
-        t = self.get_entity()
-        t.direction = None
-        t.block_id = ""
-        t.shape_id = ""
-        t.wheelchair_accessible = None
-        t.bikes_allowed = None
-        t.exceptional = None
+        t = replace(
+            self.canonical_entity(),
+            direction=None,
+            block_id="",
+            shape_id="",
+            wheelchair_accessible=None,
+            bikes_allowed=None,
+            exceptional=None,
+        )
 
         self.assertTupleEqual(
             t.sql_marshall(),
@@ -46,22 +46,12 @@ class TestAgency(AbstractTestEntity.Template[Trip]):
         )
 
     def test_sql_primary_key(self) -> None:
-        self.assertTupleEqual(self.get_entity().sql_primary_key(), ("0",))
+        self.assertTupleEqual(self.canonical_entity().sql_primary_key(), ("0",))
 
     def test_sql_unmarshall(self) -> None:
         t = Trip.sql_unmarshall(("0", "R0", "C0", "Foo", "", 0, "B0", "S0", 1, 0, 0))
 
-        self.assertEqual(t.id, "0")
-        self.assertEqual(t.route_id, "R0")
-        self.assertEqual(t.calendar_id, "C0")
-        self.assertEqual(t.headsign, "Foo")
-        self.assertEqual(t.short_name, "")
-        self.assertEqual(t.direction, Trip.Direction.OUTBOUND)
-        self.assertEqual(t.block_id, "B0")
-        self.assertEqual(t.shape_id, "S0")
-        self.assertEqual(t.wheelchair_accessible, True)
-        self.assertEqual(t.bikes_allowed, False)
-        self.assertEqual(t.exceptional, False)
+        self.assertEqual(t, self.canonical_entity())
 
     def test_sql_unmarshall_unknowns(self) -> None:
         t = Trip.sql_unmarshall(("0", "R0", "C0", "Foo", "", None, None, None, None, None, None))
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import ClassVar, Mapping, Optional
 from unittest import TestCase
@@ -9,6 +10,26 @@ from impuls.tools.testing_mocks import MockFile, MockResource
 FIXTURES_DIR = Path(__file__).with_name("fixtures")
 
 
+@lru_cache(maxsize=None)
+def _load_fixture_bytes(name: str) -> bytes:
+    return (FIXTURES_DIR / name).read_bytes()
+
+
+@lru_cache(maxsize=None)
+def _empty_db_bytes() -> bytes:
+    with MockFile() as path:
+        DBConnection.create_with_schema(path).close()
+        content = path.read_bytes()
+    return content
+
+
+def create_empty_db(path: Path) -> DBConnection:
+    """Equivalent to DBConnection.create_with_schema(path),
+    except that the schema is only created once per session and then copied."""
+    path.write_bytes(_empty_db_bytes())
+    return DBConnection(path)
+
+
 class AbstractTestTask:
     # NOTE: Nested classes are necessary to prevent abstract test cases
     #       from being discovered and run.
@@ -25,9 +46,12 @@ class AbstractTestTask:
         def _prepare_db(self) -> DBConnection:
             db_path = self.workspace.path / "impuls.db"
             if self.db_name:
-                return DBConnection.cloned(from_=Path(FIXTURES_DIR, self.db_name), in_=db_path)
+                # Fixture databases are read once and written out as-is for every test,
+                # which is much faster than sqlite3's backup API used by DBConnection.cloned
+                db_path.write_bytes(_load_fixture_bytes(self.db_name))
+                return DBConnection(db_path)
             else:
-                return DBConnection.create_with_schema(db_path)
+                return create_empty_db(db_path)
 
         def _prepare_resource(
             self,
@@ -62,6 +86,9 @@ class AbstractTestTask:
                 resources=self._prepare_resources(),
                 options=self.options,
             )
+            # Test databases are thrown away - skip syncing them to disk
+            self.runtime.db.raw_execute("PRAGMA synchronous=OFF")
+            self.runtime.db.raw_execute("PRAGMA journal_mode=MEMORY")
 
         def tearDown(self) -> None:
             super().tearDown()
@@ -4,10 +4,14 @@ from impuls import DBConnection, LocalResource, Pipeline, TaskRuntime
 from impuls.model import Agency, FeedInfo, Route, Stop
 from impuls.resource import ManagedResource
 from impuls.tasks.merge import DatabaseToMerge, Merge, RouteHash, StopHash, pick_closest_stop
-from impuls.tools.iteration import walk_len
 
 from ..test_pipeline import DummyTask
-from .template_testcase import FIXTURES_DIR, AbstractTestTask
+from .template_testcase import FIXTURES_DIR, AbstractTestTask, create_empty_db
+
+
+def count_rows(db: DBConnection, table: str, where: str = "1") -> int:
+    sql = f"SELECT COUNT(*) FROM {table} WHERE {where}"
+    return cast(int, db.raw_execute(sql).one_must("SELECT COUNT(*) must return one row")[0])
 
 
 class TestMergeIntoEmpty(AbstractTestTask.Template):
@@ -51,13 +55,10 @@ class TestMergeIntoEmpty(AbstractTestTask.Template):
         )
 
         # Calendar exceptions shouldn't be merged as well
-        calendar_exceptions = list(
-            cast(str, i[0])
-            for i in self.runtime.db.raw_execute("SELECT calendar_id FROM calendar_exceptions")
-        )
-        self.assertEqual(len(calendar_exceptions), 26)
-        self.assertEqual(walk_len(i for i in calendar_exceptions if i.startswith("1:")), 14)
-        self.assertEqual(walk_len(i for i in calendar_exceptions if i.startswith("2:")), 12)
+        db = self.runtime.db
+        self.assertEqual(count_rows(db, "calendar_exceptions"), 26)
+        self.assertEqual(count_rows(db, "calendar_exceptions", "calendar_id LIKE '1:%'"), 14)
+        self.assertEqual(count_rows(db, "calendar_exceptions", "calendar_id LIKE '2:%'"), 12)
 
         # Routes should be merged
         routes = list(self.runtime.db.raw_execute("SELECT * FROM routes ORDER BY route_id"))
@@ -136,12 +137,9 @@ class TestMergeIntoEmpty(AbstractTestTask.Template):
         )
 
         # Trips - should not be merged
-        trips = list(
-            cast(str, i[0]) for i in self.runtime.db.raw_execute("SELECT trip_id FROM trips")
-        )
-        self.assertEqual(len(trips), 744)
-        self.assertEqual(walk_len(i for i in trips if i.startswith("1:")), 372)
-        self.assertEqual(walk_len(i for i in trips if i.startswith("2:")), 372)
+        self.assertEqual(count_rows(db, "trips"), 744)
+        self.assertEqual(count_rows(db, "trips", "trip_id LIKE '1:%'"), 372)
+        self.assertEqual(count_rows(db, "trips", "trip_id LIKE '2:%'"), 372)
 
     def test_pre_merge_pipeline(self) -> None:
         dummy_task_old = DummyTask()
@@ -200,13 +198,10 @@ class TestMergeIntoExisting(AbstractTestTask.Template):
         )
 
         # Calendar exceptions shouldn't be merged as well
-        calendar_exceptions = list(
-            cast(str, i[0])
-            for i in self.runtime.db.raw_execute("SELECT calendar_id FROM calendar_exceptions")
-        )
-        self.assertEqual(len(calendar_exceptions), 26)
-        self.assertEqual(walk_len(i for i in calendar_exceptions if not i.startswith("1:")), 14)
-        self.assertEqual(walk_len(i for i in calendar_exceptions if i.startswith("1:")), 12)
+        db = self.runtime.db
+        self.assertEqual(count_rows(db, "calendar_exceptions"), 26)
+        self.assertEqual(count_rows(db, "calendar_exceptions", "calendar_id NOT LIKE '1:%'"), 14)
+        self.assertEqual(count_rows(db, "calendar_exceptions", "calendar_id LIKE '1:%'"), 12)
 
         # Routes should be merged
         routes = list(self.runtime.db.raw_execute("SELECT * FROM routes ORDER BY route_id"))
@@ -285,12 +280,9 @@ class TestMergeIntoExisting(AbstractTestTask.Template):
         )
 
         # Trips - should not be merged
-        trips = list(
-            cast(str, i[0]) for i in self.runtime.db.raw_execute("SELECT trip_id FROM trips")
-        )
-        self.assertEqual(len(trips), 744)
-        self.assertEqual(walk_len(i for i in trips if not i.startswith("1:")), 372)
-        self.assertEqual(walk_len(i for i in trips if i.startswith("1:")), 372)
+        self.assertEqual(count_rows(db, "trips"), 744)
+        self.assertEqual(count_rows(db, "trips", "trip_id NOT LIKE '1:%'"), 372)
+        self.assertEqual(count_rows(db, "trips", "trip_id LIKE '1:%'"), 372)
 
     def test_pre_merge_pipeline(self) -> None:
         dummy_task_new = DummyTask()
@@ -348,10 +340,10 @@ class TestMergeRoutes(AbstractTestTask.Template):
 
         self.assertEqual(RouteHash.of(r1), RouteHash.of(r2))
 
-        db1 = DBConnection.create_with_schema(self.workspace.path / "1.db")
+        db1 = create_empty_db(self.workspace.path / "1.db")
         db1.create(self.agency)
         db1.create(r1)
-        db2 = DBConnection.create_with_schema(self.workspace.path / "2.db")
+        db2 = create_empty_db(self.workspace.path / "2.db")
         db2.create(self.agency)
         db2.create(r2)
 
@@ -391,10 +383,10 @@ class TestMergeRoutes(AbstractTestTask.Template):
 
         self.assertNotEqual(RouteHash.of(r1), RouteHash.of(r2))
 
-        db1 = DBConnection.create_with_schema(self.workspace.path / "1.db")
+        db1 = create_empty_db(self.workspace.path / "1.db")
         db1.create(self.agency)
         db1.create(r1)
-        db2 = DBConnection.create_with_schema(self.workspace.path / "2.db")
+        db2 = create_empty_db(self.workspace.path / "2.db")
         db2.create(self.agency)
         db2.create(r2)
 
@@ -440,10 +432,10 @@ class TestMergeRoutes(AbstractTestTask.Template):
 
         self.assertNotEqual(RouteHash.of(r1), RouteHash.of(r2))
 
-        db1 = DBConnection.create_with_schema(self.workspace.path / "1.db")
+        db1 = create_empty_db(self.workspace.path / "1.db")
         db1.create(self.agency)
         db1.create(r1)
-        db2 = DBConnection.create_with_schema(self.workspace.path / "2.db")
+        db2 = create_empty_db(self.workspace.path / "2.db")
         db2.create(self.agency)
         db2.create(r2)
 
@@ -522,9 +514,9 @@ class TestMergeStops(AbstractTestTask.Template):
         s2 = Stop("TYO", "Tokyo", 35.68124, 139.76653)
         self.assertEqual(StopHash.of(s1), StopHash.of(s2))
 
-        db1 = DBConnection.create_with_schema(self.workspace.path / "1.db")
+        db1 = create_empty_db(self.workspace.path / "1.db")
         db1.create(s1)
-        db2 = DBConnection.create_with_schema(self.workspace.path / "2.db")
+        db2 = create_empty_db(self.workspace.path / "2.db")
         db2.create(s2)
 
         runtime = TaskRuntime(
@@ -549,9 +541,9 @@ class TestMergeStops(AbstractTestTask.Template):
         s2 = Stop("TYO", "Tokyo", 35.682, 139.76495)
         self.assertEqual(StopHash.of(s1), StopHash.of(s2))
 
-        db1 = DBConnection.create_with_schema(self.workspace.path / "1.db")
+        db1 = create_empty_db(self.workspace.path / "1.db")
         db1.create(s1)
-        db2 = DBConnection.create_with_schema(self.workspace.path / "2.db")
+        db2 = create_empty_db(self.workspace.path / "2.db")
         db2.create(s2)
 
         runtime = TaskRuntime(
@@ -579,9 +571,9 @@ class TestMergeStops(AbstractTestTask.Template):
         s2 = Stop("TYO", "Tokyo", 35.68124, 139.76653, "JK01")
         self.assertNotEqual(StopHash.of(s1), StopHash.of(s2))
 
-        db1 = DBConnection.create_with_schema(self.workspace.path / "1.db")
+        db1 = create_empty_db(self.workspace.path / "1.db")
         db1.create(s1)
-        db2 = DBConnection.create_with_schema(self.workspace.path / "2.db")
+        db2 = create_empty_db(self.workspace.path / "2.db")
         db2.create(s2)
 
         runtime = TaskRuntime(
@@ -614,9 +606,9 @@ class TestMergeStops(AbstractTestTask.Template):
         s2 = Stop("JY01", "Tokyo", 35.68121, 139.76668)
         self.assertNotEqual(StopHash.of(s1), StopHash.of(s2))
 
-        db1 = DBConnection.create_with_schema(self.workspace.path / "1.db")
+        db1 = create_empty_db(self.workspace.path / "1.db")
         db1.create(s1)
-        db2 = DBConnection.create_with_schema(self.workspace.path / "2.db")
+        db2 = create_empty_db(self.workspace.path / "2.db")
         db2.create(s2)
 
         runtime = TaskRuntime(
@@ -649,9 +641,9 @@ class TestMergeFeedInfo(AbstractTestTask.Template):
     def test_existing(self) -> None:
         self.runtime.db.create(FeedInfo("Existing", "https://example.com", "en"))
 
-        db1 = DBConnection.create_with_schema(self.workspace.path / "1.db")
+        db1 = create_empty_db(self.workspace.path / "1.db")
         db1.create(FeedInfo("Incoming 1", "https://example.com", "en", "v1"))
-        db2 = DBConnection.create_with_schema(self.workspace.path / "2.db")
+        db2 = create_empty_db(self.workspace.path / "2.db")
         db2.create(FeedInfo("Incoming 2", "https://example.com", "en", "v2"))
 
         runtime = TaskRuntime(
@@ -672,9 +664,9 @@ class TestMergeFeedInfo(AbstractTestTask.Template):
         self.assertEqual(fi.version, "")
 
     def test_all_incoming(self) -> None:
-        db1 = DBConnection.create_with_schema(self.workspace.path / "1.db")
+        db1 = create_empty_db(self.workspace.path / "1.db")
         db1.create(FeedInfo("Incoming 1", "https://example.com", "en", "v1"))
-        db2 = DBConnection.create_with_schema(self.workspace.path / "2.db")
+        db2 = create_empty_db(self.workspace.path / "2.db")
         db2.create(FeedInfo("Incoming 2", "https://example.com", "en", "v2"))
 
         runtime = TaskRuntime(
@@ -695,9 +687,9 @@ class TestMergeFeedInfo(AbstractTestTask.Template):
         self.assertEqual(fi.version, "v1/v2")
 
     def test_partial_incoming(self) -> None:
-        db1 = DBConnection.create_with_schema(self.workspace.path / "1.db")
+        db1 = create_empty_db(self.workspace.path / "1.db")
         db1.create(FeedInfo("Incoming 1", "https://example.com", "en", "v1"))
-        DBConnection.create_with_schema(self.workspace.path / "2.db")
+        create_empty_db(self.workspace.path / "2.db")
 
         runtime = TaskRuntime(
             db=self.runtime.db,